@@ -0,0 +1,117 @@
+import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from github_analyzer import GitHubAnalyzer
+from requirements_analyzer import RequirementsAnalyzer
+from slack_integration import SlackIntegration
+
+# SETUP LOGGING OPTIONS
+logging.basicConfig(stream=sys.stdout)
+log = logging.getLogger("codebase-planner")
+log.setLevel(logging.INFO)
+
+
+# drives the plan: docs become steps, git history marks progress,
+# Slack keeps the humans in the loop
+class CleanCoderPlanner:
+    def __init__(self, repo_path=".", docs_folder="docs", output_folder="output"):
+        self.requirements_analyzer = RequirementsAnalyzer(docs_folder, output_folder)
+        self.github_analyzer = GitHubAnalyzer(repo_path, output_folder)
+        self.slack_integration = SlackIntegration()
+        self.implementation_steps = []
+        # steps bucketed by state; _pending stays sorted by order so the
+        # next step is always _pending[0] instead of a min() scan
+        self._pending = []
+        self._completed = []
+        # Slack sends run on a small pool so HTTPS round-trips do not
+        # block the planning loop
+        self._slack_executor = ThreadPoolExecutor(max_workers=2)
+        self._wakeup = threading.Event()
+
+    # build the plan from the docs folder and write it out
+    def initialize_plan(self):
+        self.implementation_steps = self.requirements_analyzer.analyze_requirements()
+        self.requirements_analyzer.save_implementation_plan()
+        self._index_steps()
+        return self.implementation_steps
+
+    def _index_steps(self):
+        self._pending = sorted(
+            (s for s in self.implementation_steps if not s.get('completed')),
+            key=lambda s: s.get('order', 0))
+        self._completed = [s for s in self.implementation_steps if s.get('completed')]
+
+    # refresh step completion from recent commits and rewrite the plan
+    def update_implementation_progress(self):
+        self._refresh_progress()
+        self._save_plan()
+        return self.implementation_steps
+
+    # analyze recent commits and move newly completed steps between
+    # buckets; order is preserved
+    def _refresh_progress(self):
+        if not self.implementation_steps:
+            self.initialize_plan()
+        self.implementation_steps = self.github_analyzer.analyze_implementation_progress(
+            self.implementation_steps)
+        still_pending = []
+        for step in self._pending:
+            if step.get('completed'):
+                self._completed.append(step)
+            else:
+                still_pending.append(step)
+        self._pending = still_pending
+
+    def _save_plan(self):
+        self.requirements_analyzer.implementation_steps = self.implementation_steps
+        self.requirements_analyzer.save_implementation_plan()
+
+    # submit the progress post to the executor; callers that care wait on the future
+    def send_progress_update(self):
+        return self._slack_executor.submit(
+            self.slack_integration.send_progress_update,
+            self._completed, self._pending)
+
+    def send_next_implementation_request(self):
+        if not self._pending:
+            log.info("All implementation steps are completed")
+            return None
+        return self._slack_executor.submit(
+            self.slack_integration.send_implementation_request, self._pending[0])
+
+    # one cycle: refresh progress, then post to Slack in the background
+    # while the plan file is being rewritten
+    def run_planning_cycle(self):
+        self._refresh_progress()
+        next_step = self._pending[0] if self._pending else None
+        future = self._slack_executor.submit(
+            self.slack_integration.send_cycle_update,
+            self._completed, self._pending, next_step)
+        self._save_plan()
+        wait([future])
+        return self.implementation_steps
+
+    def run_continuous_loop(self, interval_minutes=30):
+        log.info("Starting planning loop, interval: {0} minutes".format(interval_minutes))
+        interval = interval_minutes * 60
+        prefetch_lead = min(30, interval / 2)
+        while True:
+            try:
+                self.run_planning_cycle()
+            except Exception as e:
+                log.error("planning cycle failed: " + str(e))
+            # sleep most of the interval, then warm the git caches in the
+            # background so the next cycle starts with data already in hand
+            self._wakeup.wait(interval - prefetch_lead)
+            threading.Thread(target=self._prefetch_git_data, daemon=True).start()
+            self._wakeup.wait(prefetch_lead)
+
+    # runs on a daemon thread; hands its result to the next cycle through
+    # the analyzer's HEAD-keyed cache
+    def _prefetch_git_data(self):
+        try:
+            self.github_analyzer.warm_cache()
+        except Exception as e:
+            log.warning("git prefetch failed: " + str(e))
@@ -0,0 +1,44 @@
+import argparse
+import logging
+import sys
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='codebase-planner',
+        description='Plan implementation steps from docs and track progress in git')
+    parser.add_argument('--repo', default='.', help='path to the git repository')
+    parser.add_argument('--docs', default='docs', help='folder containing the markdown docs')
+    parser.add_argument('--output', default='output', help='folder for generated artifacts')
+    sub = parser.add_subparsers(dest='command')
+    sub.add_parser('init', help='generate the implementation plan from the docs')
+    sub.add_parser('update', help='refresh progress from recent commits and post it')
+    run = sub.add_parser('run', help='run planning cycles continuously')
+    run.add_argument('--interval', type=int, default=30, help='minutes between cycles')
+
+    args = parser.parse_args(argv)
+    if not args.command:
+        parser.print_help()
+        return 1
+
+    # deferred on purpose: CleanCoderPlanner drags in the git, Slack and
+    # AWS machinery, which --help and argument errors should not pay for
+    logging.basicConfig(stream=sys.stdout)
+    from clean_coder_planner import CleanCoderPlanner
+
+    planner = CleanCoderPlanner(
+        repo_path=args.repo, docs_folder=args.docs, output_folder=args.output)
+    if args.command == 'init':
+        planner.initialize_plan()
+    elif args.command == 'update':
+        planner.update_implementation_progress()
+        future = planner.send_progress_update()
+        if future is not None:
+            future.result()
+    elif args.command == 'run':
+        planner.run_continuous_loop(interval_minutes=args.interval)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,364 @@
+import functools
+import os
+import re
+import logging
+import shelve
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+# libgit2 lets us walk commits and read blobs in-process instead of
+# spawning a git subprocess per query; fall back to the git CLI without it
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# pyahocorasick finds every keyword in a text in one linear DFA pass;
+# without it we keep the per-keyword substring scan
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# filler words that carry no signal for matching steps against commits
+_COMMON_WORDS = frozenset({
+    'the', 'and', 'for', 'that', 'this', 'with', 'from', 'are', 'was',
+    'will', 'has', 'have', 'had', 'can', 'could', 'should', 'would',
+    'may', 'might', 'must', 'all', 'any', 'each', 'its', 'not', 'but',
+    'when', 'then', 'than', 'into', 'out', 'use', 'used', 'using',
+    'add', 'adds', 'added', 'new', 'more', 'some', 'also', 'been',
+    'implement', 'implementation', 'create', 'update', 'support',
+})
+
+
+# read and lowercase one file; module-level so the process pool can pickle it
+def _read_lower(path):
+    try:
+        with open(path) as f:
+            return f.read().lower()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+# SETUP LOGGING OPTIONS
+logging.basicConfig(stream=sys.stdout)
+log = logging.getLogger("codebase-planner")
+log.setLevel(logging.INFO)
+
+
+# analyzes the local git repository to track implementation progress
+class GitHubAnalyzer:
+    def __init__(self, repo_path=".", output_folder="output"):
+        self.repo_path = repo_path
+        self.output_folder = output_folder
+        self.repo = None
+        if pygit2 is not None:
+            try:
+                self.repo = pygit2.Repository(repo_path)
+            except Exception as e:
+                log.warning("could not open repository with pygit2, falling back to git CLI: " + str(e))
+        # cheap tuple check for extension exclusions, one compiled
+        # alternation for the directory patterns
+        self._excluded_suffixes = (
+            '.md', '.json', '.txt', '.lock', '.log',
+            '.png', '.jpg', '.svg', '.ico', '.map', '.min.js',
+        )
+        self._excluded_re = re.compile(
+            r'\.git/|node_modules/|__pycache__/|dist/|build/'
+            r'|\.idea/|\.vscode/|venv/|\.egg-info/'
+        )
+        # repeated lookups of the same path hit memory instead of disk;
+        # recreate the analyzer (or a new cache wrapper) when HEAD moves
+        self.get_file_content = functools.lru_cache(maxsize=1024)(self._read_file_content)
+
+    # get commit metadata and changed files in one git log pass
+    def get_recent_commits(self, days=30):
+        if self.repo is not None:
+            return self._recent_commits_pygit2(days)
+        cmd = [
+            'git', '-C', self.repo_path, 'log', '--name-only',
+            '--since={0} days ago'.format(days),
+            '--pretty=format:__C__%H|%an|%ad|%s',
+        ]
+        # parse the log as it streams instead of buffering it whole;
+        # on a busy repo the 30-day window can be megabytes of text
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True, bufsize=1)
+        except OSError as e:
+            log.error("could not run git log: " + str(e))
+            return []
+        commits = []
+        current = None
+        for line in proc.stdout:
+            line = line.strip()
+            if line.startswith('__C__'):
+                header = line[5:].split('|', 3)
+                if len(header) < 4:
+                    current = None
+                    continue
+                current = {
+                    'sha': header[0],
+                    'author': header[1],
+                    'date': header[2],
+                    'message': header[3],
+                    'files': [],
+                }
+                commits.append(current)
+            elif line and current is not None:
+                current['files'].append(line)
+        proc.wait()
+        if proc.returncode != 0:
+            log.error("git log exited with code {0}".format(proc.returncode))
+            return []
+        return commits
+
+    # in-process commit walk via libgit2: no fork/exec, no stdout parsing
+    def _recent_commits_pygit2(self, days):
+        cutoff = (datetime.now() - timedelta(days=days)).timestamp()
+        commits = []
+        try:
+            for c in self.repo.walk(self.repo.head.target, pygit2.GIT_SORT_TIME):
+                if c.commit_time < cutoff:
+                    break
+                commits.append({
+                    'sha': str(c.id),
+                    'author': c.author.name,
+                    'date': datetime.fromtimestamp(c.commit_time).strftime('%a %b %d %H:%M:%S %Y'),
+                    'message': c.message.splitlines()[0] if c.message else '',
+                    'files': self._changed_files_pygit2(c),
+                })
+        except Exception as e:
+            log.error("could not walk repository: " + str(e))
+        return commits
+
+    def _changed_files_pygit2(self, commit):
+        if commit.parents:
+            diff = commit.parents[0].tree.diff_to_tree(commit.tree)
+        else:
+            diff = commit.tree.diff_to_tree()
+        return [delta.new_file.path for delta in diff.deltas]
+
+    # changed files for a single commit, for ad-hoc use;
+    # the analysis loop gets file lists from get_recent_commits directly
+    def get_changed_files(self, commit_sha):
+        if self.repo is not None:
+            try:
+                return self._changed_files_pygit2(self.repo[commit_sha])
+            except KeyError:
+                log.error("unknown commit " + commit_sha)
+                return []
+        cmd = [
+            'git', '-C', self.repo_path, 'show',
+            '--name-only', '--pretty=format:', commit_sha,
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        except subprocess.CalledProcessError as e:
+            log.error("could not read commit " + commit_sha + ": " + str(e))
+            return []
+        return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+
+    # read a file from the HEAD tree (in-process) or the working tree;
+    # accessed through the lru_cache wrapper installed in __init__
+    def _read_file_content(self, file_path):
+        if self.repo is not None:
+            try:
+                tree = self.repo[self.repo.head.target].tree
+                return self.repo[tree[file_path].id].data.decode()
+            except (KeyError, UnicodeDecodeError):
+                return None
+        try:
+            with open(os.path.join(self.repo_path, file_path)) as f:
+                return f.read()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    # mark pending steps as completed when recent commits look like they implement them
+    def analyze_implementation_progress(self, implementation_steps):
+        # the repository mine only changes when HEAD moves; reuse the cached
+        # messages and file tokens so the polling loop is nearly free when idle
+        head = self._head_sha()
+        cached = self._load_analysis_cache(head)
+        if cached is None:
+            cached = self._gather_repo_data()
+            self._store_analysis_cache(head, cached)
+        commit_messages, relevant_files, file_tokens = cached
+
+        # extract each step's keywords once; _extract_keywords lowercases
+        # internally, so the description is passed through as-is
+        step_keywords = [
+            None if step.get('completed')
+            else self._extract_keywords(step['description'])
+            for step in implementation_steps
+        ]
+
+        # with pyahocorasick, scan every message once against the union of all
+        # step keywords and bucket the hits, instead of a substring pass per
+        # (step, message) pair
+        message_hits = None
+        if ahocorasick is not None:
+            union_keywords = set()
+            for keywords in step_keywords:
+                if keywords:
+                    union_keywords |= keywords
+            if union_keywords:
+                automaton = self._build_keyword_automaton(union_keywords)
+                message_hits = [
+                    {value for _, value in automaton.iter(message.lower())}
+                    for message in commit_messages
+                ]
+        if message_hits is None:
+            message_hits = [message.lower() for message in commit_messages]
+
+        # each step only reads the shared message/file data and writes to
+        # its own dict, so the matching fans out safely across threads
+        def analyze_step(pair):
+            step, keywords = pair
+            if step.get('completed') or not keywords:
+                return step
+            for hits in message_hits:
+                if self._has_enough_keywords(keywords, hits):
+                    step['completed'] = True
+                    return step
+            for file_path in relevant_files:
+                tokens = file_tokens.get(file_path)
+                if tokens and self._has_enough_keywords(keywords, tokens):
+                    step['completed'] = True
+                    return step
+            return step
+
+        pairs = list(zip(implementation_steps, step_keywords))
+        if len(pairs) > 8:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+                implementation_steps = list(ex.map(analyze_step, pairs))
+        else:
+            implementation_steps = [analyze_step(pair) for pair in pairs]
+        return implementation_steps
+
+    # mine commits and tokenize changed files; this is the expensive part
+    # of an analysis run and the payload of the HEAD-keyed cache
+    def _gather_repo_data(self):
+        commits = self.get_recent_commits()
+        all_changed_files = []
+        commit_messages = []
+        for commit in commits:
+            all_changed_files.extend(commit['files'])
+            commit_messages.append(commit['message'])
+
+        relevant_files = [f for f in all_changed_files if self._is_relevant_file(f)]
+        file_contents = self._load_file_contents(relevant_files)
+        # tokenize each file once so the per-step check is a set intersection,
+        # not a substring scan repeated for every (step, file) pair
+        file_tokens = {
+            f: set(_WORD_RE.findall(content))
+            for f, content in file_contents.items() if content
+        }
+        return (commit_messages, relevant_files, file_tokens)
+
+    # populate the analysis cache ahead of time, e.g. from a prefetch thread
+    def warm_cache(self):
+        head = self._head_sha()
+        if self._load_analysis_cache(head) is None:
+            self._store_analysis_cache(head, self._gather_repo_data())
+
+    def _head_sha(self):
+        if self.repo is not None:
+            try:
+                return str(self.repo.head.target)
+            except Exception:
+                return None
+        try:
+            result = subprocess.run(
+                ['git', '-C', self.repo_path, 'rev-parse', 'HEAD'],
+                capture_output=True, text=True, check=True)
+            return result.stdout.strip()
+        except subprocess.CalledProcessError:
+            return None
+
+    def _load_analysis_cache(self, head):
+        if not head:
+            return None
+        try:
+            with shelve.open(self._cache_path()) as cache:
+                if cache.get('head') == head:
+                    return cache['data']
+        except Exception as e:
+            log.warning("could not read analysis cache: " + str(e))
+        return None
+
+    def _store_analysis_cache(self, head, data):
+        if not head:
+            return
+        try:
+            os.makedirs(self.output_folder, exist_ok=True)
+            with shelve.open(self._cache_path()) as cache:
+                cache['head'] = head
+                cache['data'] = data
+        except Exception as e:
+            log.warning("could not write analysis cache: " + str(e))
+
+    def _cache_path(self):
+        return os.path.join(self.output_folder, '.analysis_cache')
+
+    def _build_keyword_automaton(self, keywords):
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+
+    # preload lowercased contents for all relevant files in one go;
+    # a process pool only pays off once the file list is big enough
+    def _load_file_contents(self, relevant_files):
+        paths = [os.path.join(self.repo_path, f) for f in relevant_files]
+        if len(relevant_files) > 32:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+                contents = list(ex.map(_read_lower, paths))
+        else:
+            contents = [_read_lower(p) for p in paths]
+        return dict(zip(relevant_files, contents))
+
+    # build a short description of recently changed files for a step
+    def _get_context_for_step(self, step, relevant_files):
+        # dedupe once, preserving the order files were seen in
+        unique_files = list(dict.fromkeys(relevant_files))
+        context = "Relevant files changed recently:\n"
+        for file in unique_files[:5]:
+            context += "- {0}\n".format(file)
+        if len(unique_files) > 5:
+            context += "- ...and {0} more\n".format(len(unique_files) - 5)
+        return context
+
+    def _is_relevant_file(self, file_path):
+        if file_path.endswith(self._excluded_suffixes):
+            return False
+        return self._excluded_re.search(file_path) is None
+
+    def _extract_keywords(self, text):
+        words = _WORD_RE.findall(text.lower())
+        return {word for word in words if len(word) > 2 and word not in _COMMON_WORDS}
+
+    def _has_enough_keywords(self, keywords, text, threshold=0.3):
+        if not keywords:
+            return False
+        need = len(keywords) * threshold
+        if isinstance(text, (set, frozenset)):
+            # token sets: whole-word matches, no substring false positives
+            return len(keywords & text) >= need
+        # substring path: stop scanning as soon as the threshold is reached
+        # or can no longer be reached
+        present = 0
+        remaining = len(keywords)
+        for keyword in keywords:
+            if keyword in text:
+                present += 1
+                if present >= need:
+                    return True
+            remaining -= 1
+            if present + remaining < need:
+                return False
+        return False
@@ -0,0 +1,357 @@
+import itertools
+import os
+import pickle
+import re
+import logging
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+# SETUP LOGGING OPTIONS
+logging.basicConfig(stream=sys.stdout)
+log = logging.getLogger("codebase-planner")
+log.setLevel(logging.INFO)
+
+# compiled once at import; these run against every doc and section
+_SECTION_BOUNDARY_RE = re.compile(r'^##\s+', re.MULTILINE)
+# one scan emits either a list item or a paragraph run; paragraph
+# continuation stops at blank lines and at lines that are list items
+_ITEM_OR_PARA_RE = re.compile(
+    r'^\s*(?:[-*+]|\d+\.)\s+(?P<item>.+?)$'
+    r'|(?P<para>^[^\n].*(?:\n(?!\n|\s*(?:[-*+]|\d+\.)\s).*)*)',
+    re.MULTILINE)
+_TASK_RE = re.compile(r'^\s*[-*+]\s+\[([ xX])\]\s+(.*?)$', re.MULTILINE)
+_PARA_SPLIT = re.compile(r'\n\n+')
+_NUM_RE = re.compile(r'^\s*(\d+)\.?\s+(.*?)$', re.MULTILINE)
+
+# one pass over a section title decides its bucket; the group name
+# that matched is the category key
+_CATEGORY_RE = re.compile(
+    r'(?P<functional>feature|functionality|capabilities)'
+    r'|(?P<technical>technical|implementation|technology)'
+    r'|(?P<ui>ui|interface|user experience)'
+    r'|(?P<architecture>architecture|structure|design)',
+    re.IGNORECASE)
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# probed in priority order against the step's token set
+_STEP_CATEGORY_KEYWORDS = (
+    ('ui', frozenset({'ui', 'interface', 'layout', 'component', 'view'})),
+    ('backend', frozenset({'api', 'backend', 'endpoint', 'database', 'server'})),
+    ('testing', frozenset({'test', 'tests', 'validation', 'verify'})),
+    ('infrastructure', frozenset({'deploy', 'deployment', 'infrastructure', 'pipeline', 'docker'})),
+)
+
+
+# one implementation step; slots keep instances compact (no per-step
+# __dict__) and make attribute access a fixed-offset load
+@dataclass(slots=True)
+class Step:
+    description: str
+    completed: bool = False
+    source: str = 'generated'
+    category: str = None
+    id: str = None
+    order: int = 0
+
+    # the planner and Slack code read steps with dict-style access;
+    # these keep that interface working on the slotted instances
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+
+# one linear scan over the buffer; sections are sliced out lazily instead
+# of materializing a list of copies via re.split
+def _iter_sections(content):
+    prev = None
+    for match in _SECTION_BOUNDARY_RE.finditer(content):
+        if prev is not None:
+            yield content[prev.end():match.start()]
+        prev = match
+    if prev is not None:
+        yield content[prev.end():]
+
+
+# walk paragraph boundaries and slice one segment at a time, instead of
+# split('\n\n') materializing every paragraph of the section up front
+def _iter_paragraphs(text):
+    prev = 0
+    for match in _PARA_SPLIT.finditer(text):
+        yield text[prev:match.start()]
+        prev = match.end()
+    yield text[prev:]
+
+
+# turns the markdown docs folder into categorized requirements and an implementation plan
+class RequirementsAnalyzer:
+    def __init__(self, docs_folder="docs", output_folder="output"):
+        self.docs_folder = docs_folder
+        self.output_folder = output_folder
+        self.implementation_steps = []
+        # step generation is deterministic in the docs, so results are
+        # memoized on the folder's (name, mtime, size) fingerprint
+        self._cache_key = None
+        self._cache_value = None
+        # loaded docs keyed by the same fingerprint, so a generate followed
+        # by extract_requirements or a retry does not reread the folder
+        self._docs = None
+        self._docs_key = None
+
+    # read every markdown doc in the docs folder
+    def load_docs(self):
+        docs = {}
+        if not os.path.isdir(self.docs_folder):
+            log.warning("docs folder not found: " + self.docs_folder)
+            return docs
+        entries = [e for e in os.scandir(self.docs_folder) if e.name.endswith('.md')]
+        if not entries:
+            return docs
+
+        def _read(entry):
+            try:
+                # binary read sized from the scandir stat: one read syscall
+                # and one decode, no incremental text-mode decoding layer
+                with open(entry.path, 'rb') as f:
+                    return entry.name, f.read(entry.stat().st_size + 1).decode('utf-8')
+            except (OSError, UnicodeDecodeError) as e:
+                log.error("could not read " + entry.name + ": " + str(e))
+                return entry.name, None
+
+        # reads release the GIL, so a thread per file overlaps the IO
+        with ThreadPoolExecutor(max_workers=min(32, len(entries))) as ex:
+            for name, content in ex.map(_read, entries):
+                if content is not None:
+                    docs[name] = content
+        return docs
+
+    # split each doc into sections and bucket their list items by category
+    def extract_requirements(self, docs):
+        # sets from the start: duplicates collapse as they arrive instead of
+        # growing a list that gets deduped at the end
+        requirements = {
+            'functional': set(),
+            'technical': set(),
+            'ui': set(),
+            'architecture': set(),
+        }
+        for filename, content in docs.items():
+            for section in _iter_sections(content):
+                section_title = section.splitlines()[0] if section else ''
+                match = _CATEGORY_RE.search(section_title)
+                if match:
+                    requirements[match.lastgroup].update(self._extract_list_items(section))
+        return {category: list(items) for category, items in requirements.items()}
+
+    # pull list items out of a section; short standalone paragraphs count too
+    def _extract_list_items(self, text):
+        out = []
+        for match in _ITEM_OR_PARA_RE.finditer(text):
+            item = match.group('item')
+            if item is not None:
+                item = item.strip()
+                if item:
+                    out.append(item)
+                continue
+            paragraph = match.group('para').strip()
+            if (paragraph and len(paragraph) < 200 and '\n' not in paragraph
+                    and not paragraph.startswith(('-', '*', '+', '#', '|', '`'))):
+                out.append(paragraph)
+        return out
+
+    # task lists and numbered lists in plan sections become implementation steps
+    def _extract_implementation_steps(self, docs):
+        steps = []
+        for filename, content in docs.items():
+            for section in _iter_sections(content):
+                section_title = section.splitlines()[0] if section else ''
+                if 'plan' not in section_title.lower() and 'step' not in section_title.lower():
+                    continue
+                tasks = _TASK_RE.findall(section)
+                if tasks:
+                    for state, description in tasks:
+                        description = description.strip()
+                        if description:
+                            steps.append(Step(
+                                description=description,
+                                completed=state in ('x', 'X'),
+                                source=filename,
+                            ))
+                    continue
+                numbered = _NUM_RE.findall(section)
+                if numbered:
+                    for _, description in numbered:
+                        description = description.strip().strip('*').strip()
+                        if description:
+                            steps.append(Step(
+                                description=description,
+                                source=filename,
+                            ))
+                    continue
+                # no explicit list at all: treat short paragraphs as steps
+                paragraphs = _iter_paragraphs(section)
+                next(paragraphs, None)  # the title block is never a step
+                for paragraph in paragraphs:
+                    paragraph = paragraph.strip()
+                    if paragraph and len(paragraph) < 200 and '\n' not in paragraph:
+                        steps.append(Step(
+                            description=paragraph,
+                            source=filename,
+                        ))
+        return steps
+
+    # generate steps from the docs; prefer explicit plan lists, otherwise
+    # derive them from the extracted requirements
+    def generate_implementation_steps(self):
+        key = self._docs_cache_key()
+        if key is not None and key == self._cache_key:
+            self.implementation_steps = self._cache_value
+            return self._cache_value
+        if key is not None:
+            cached = self._load_plan_cache(key)
+            if cached is not None:
+                self._cache_key = key
+                self._cache_value = cached
+                self.implementation_steps = cached
+                return cached
+        if self._docs is None or self._docs_key != key:
+            self._docs = self.load_docs()
+            self._docs_key = key
+        docs = self._docs
+        steps = self._extract_implementation_steps(docs)
+        if not steps:
+            requirements = self.extract_requirements(docs)
+            steps = self._generate_steps_from_requirements(requirements)
+        self.implementation_steps = steps
+        if key is not None:
+            self._cache_key = key
+            self._cache_value = steps
+            self._store_plan_cache(key, steps)
+        return steps
+
+    def _docs_cache_key(self):
+        if not os.path.isdir(self.docs_folder):
+            return None
+        try:
+            key = []
+            for entry in os.scandir(self.docs_folder):
+                if entry.name.endswith('.md'):
+                    stat = entry.stat()
+                    key.append((entry.name, stat.st_mtime_ns, stat.st_size))
+            return tuple(sorted(key))
+        except OSError:
+            return None
+
+    def _plan_cache_path(self):
+        return os.path.join(self.output_folder, '.plan_cache.pkl')
+
+    def _load_plan_cache(self, key):
+        try:
+            with open(self._plan_cache_path(), 'rb') as f:
+                cached_key, steps = pickle.load(f)
+            # reject caches written before steps became Step instances
+            if cached_key == key and all(isinstance(s, Step) for s in steps):
+                return steps
+        except (OSError, EOFError, ValueError, pickle.PickleError):
+            pass
+        return None
+
+    def _store_plan_cache(self, key, steps):
+        try:
+            os.makedirs(self.output_folder, exist_ok=True)
+            with open(self._plan_cache_path(), 'wb') as f:
+                pickle.dump((key, steps), f)
+        except (OSError, pickle.PickleError) as e:
+            log.warning("could not write plan cache: " + str(e))
+
+    def _generate_steps_from_requirements(self, requirements):
+        steps = []
+        for category, items in requirements.items():
+            for item in items:
+                steps.append(Step(
+                    description=item,
+                    source=category,
+                    category=category,
+                ))
+        return steps
+
+    # assign ids, ordering and categories to the generated steps
+    def analyze_requirements(self):
+        steps = self.generate_implementation_steps()
+        # uuid4().hex skips the dashed str() formatting
+        ids = [uuid.uuid4().hex for _ in steps]
+        for i, step in enumerate(steps):
+            step.id = ids[i]
+            step.order = i
+            if step.category is None:
+                step.category = self._categorize_step(step.description)
+        return steps
+
+    def _categorize_step(self, description):
+        # lowercase and tokenize once; each category check is then a single
+        # C-level set intersection instead of substring scans
+        tokens = set(_TOKEN_RE.findall(description.lower()))
+        for category, keywords in _STEP_CATEGORY_KEYWORDS:
+            if tokens & keywords:
+                return category
+        return 'general'
+
+    # regenerate only when the analyzer holds no steps; callers that just
+    # generated or assigned a plan save it without touching the docs again
+    def _ensure_plan(self):
+        if not self.implementation_steps:
+            self.generate_implementation_steps()
+
+    # write the plan as a markdown checklist grouped by category
+    def save_implementation_plan(self, output_file=None):
+        self._ensure_plan()
+        if output_file is None:
+            os.makedirs(self.output_folder, exist_ok=True)
+            output_file = os.path.join(self.output_folder, 'implementation_plan.md')
+        steps = self.implementation_steps
+        # struct-of-arrays view for the bulk pass: each field is pulled out
+        # of the steps exactly once, then the sort and group-by shuffle
+        # plain indices over contiguous lists instead of dereferencing a
+        # Step per comparison
+        descriptions = [s.description for s in steps]
+        completed = [s.completed for s in steps]
+        categories = [s.category or 'general' for s in steps]
+        orders = [s.order for s in steps]
+        index = sorted(range(len(steps)), key=lambda i: (categories[i], orders[i]))
+        # assemble the segments pre-encoded and hand them to the kernel in
+        # one gather-write; binary mode skips the text-layer codec and
+        # newline translation entirely
+        parts = [b"# Implementation Plan\n\n"]
+        for category, group in itertools.groupby(index, key=categories.__getitem__):
+            parts.append("## {0}\n\n".format(category.capitalize()).encode('utf-8'))
+            for i in group:
+                checkbox = '[x]' if completed[i] else '[ ]'
+                parts.append("- {0} {1}\n".format(checkbox, descriptions[i]).encode('utf-8'))
+            parts.append(b"\n")
+        with open(output_file, 'wb') as f:
+            if hasattr(os, 'writev'):
+                # one iovec per segment, batched under the kernel's IOV_MAX;
+                # writev may stop short (ENOSPC mid-write, file size limits,
+                # signals), so advance into the iovec until the batch is done
+                fd = f.fileno()
+                for start in range(0, len(parts), 1024):
+                    batch = parts[start:start + 1024]
+                    while batch:
+                        written = os.writev(fd, batch)
+                        while batch and written >= len(batch[0]):
+                            written -= len(batch[0])
+                            del batch[0]
+                        if written:
+                            batch[0] = batch[0][written:]
+            else:
+                f.writelines(parts)
+        log.info("Implementation plan written to " + output_file)
+        return output_file
@@ -0,0 +1,248 @@
+import asyncio
+import os
+import json
+import logging
+import sys
+from datetime import datetime
+
+# SETUP LOGGING OPTIONS
+logging.basicConfig(stream=sys.stdout)
+log = logging.getLogger("codebase-planner")
+log.setLevel(logging.INFO)
+
+
+# button payloads are tiny fixed-shape objects; building them with an
+# f-string skips the generic json encoder, while json.dumps still
+# escapes the caller-supplied id
+def _button_value(step_id, action):
+    return f'{{"step_id": {json.dumps(step_id)}, "action": "{action}"}}'
+
+
+# posts implementation requests, progress updates and validation asks to Slack
+class SlackIntegration:
+    def __init__(self, token=None, channel=None):
+        self.token = token or os.environ.get('SLACK_API_TOKEN')
+        secret_id = os.environ.get('SLACK_AUTOMATION_BOT')
+        if not self.token and secret_id and 'AWS_REGION' in os.environ:
+            # same secret the automation bot lambdas use; boto3 is imported
+            # here so runs with a token in the environment never pay for it.
+            # A failed lookup degrades to the token-less skip-send path
+            # instead of killing Slack-free commands
+            try:
+                import boto3
+                secrets_client = boto3.client(
+                    'secretsmanager', region_name=os.environ['AWS_REGION'])
+                secret_data = json.loads(secrets_client.get_secret_value(
+                    SecretId=secret_id)['SecretString'])
+                self.token = secret_data['SLACK_API_SECRET']
+            except Exception as e:
+                log.warning("could not fetch Slack token from Secrets Manager: " + str(e))
+        self.channel = channel or os.environ.get('SLACK_CHANNEL', '#codebase-planner')
+        # one persistent client for every post; the SDK keeps the HTTP
+        # plumbing, we keep the instance. Imported on demand so commands
+        # that never post (plan generation, --help) skip the SDK entirely
+        if self.token:
+            from slack_sdk import WebClient
+            self.client = WebClient(token=self.token)
+        else:
+            self.client = None
+        # static block scaffolding built once and treated as read-only, so
+        # each send only assembles its dynamic sections
+        self._header_impl = {
+            "type": "header",
+            "text": {"type": "plain_text", "text": "Next implementation step", "emoji": True},
+        }
+        self._header_progress = {
+            "type": "header",
+            "text": {"type": "plain_text", "text": "Implementation progress", "emoji": True},
+        }
+        self._header_validation = {
+            "type": "header",
+            "text": {"type": "plain_text", "text": "Validation request", "emoji": True},
+        }
+        self._divider = {"type": "divider"}
+        self._async_client = None
+
+    # ask the channel to pick up the next implementation step
+    def send_implementation_request(self, step):
+        if self.client is None:
+            log.warning("no Slack token configured, skipping send")
+            return None
+        return self._post("Next implementation step", self._next_step_blocks(step))
+
+    # post one request per step concurrently: N messages cost about one
+    # round-trip instead of N sequential ones
+    async def send_implementation_request_many(self, steps):
+        if not self.token:
+            log.warning("no Slack token configured, skipping send")
+            return []
+        if self._async_client is None:
+            # imported here because the async client needs aiohttp
+            from slack_sdk.web.async_client import AsyncWebClient
+            self._async_client = AsyncWebClient(token=self.token)
+        now = datetime.now().strftime('%Y-%m-%d %H:%M')
+        posts = [
+            self._async_client.chat_postMessage(
+                channel=self.channel,
+                text="Next implementation step",
+                blocks=self._next_step_blocks(step, now),
+                link_names=True)
+            for step in steps
+        ]
+        responses = []
+        for step, result in zip(steps, await asyncio.gather(*posts, return_exceptions=True)):
+            if isinstance(result, Exception):
+                log.error("Message could not be send to Slack: " + str(result))
+            else:
+                responses.append(result)
+        return responses
+
+    # post completed/pending counts and the first few tasks of each
+    def send_progress_update(self, completed_steps, pending_steps):
+        if self.client is None:
+            log.warning("no Slack token configured, skipping send")
+            return None
+        return self._post("Implementation progress update",
+                          self._progress_blocks(completed_steps, pending_steps))
+
+    # ask the channel to confirm a step that looks completed
+    def send_validation_request(self, step):
+        if self.client is None:
+            log.warning("no Slack token configured, skipping send")
+            return None
+        blocks = [
+            self._header_validation,
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": "*Please validate this step:*\n" + step['description'],
+                },
+            },
+            {
+                "type": "actions",
+                "elements": [
+                    {
+                        "type": "button",
+                        "text": {"type": "plain_text", "emoji": True, "text": "Looks good"},
+                        "style": "primary",
+                        "value": _button_value(step.get('id', 'unknown'), "confirm"),
+                        "action_id": "validate_confirm",
+                    },
+                    {
+                        "type": "button",
+                        "text": {"type": "plain_text", "emoji": True, "text": "Needs more work"},
+                        "style": "danger",
+                        "value": _button_value(step.get('id', 'unknown'), "reject"),
+                        "action_id": "validate_reject",
+                    },
+                ],
+            },
+        ]
+        return self._post("Validation request", blocks)
+
+    # one combined post for a planning cycle: progress plus the next step,
+    # so a cycle costs a single Slack round-trip
+    def send_cycle_update(self, completed_steps, pending_steps, next_step=None):
+        if self.client is None:
+            log.warning("no Slack token configured, skipping send")
+            return None
+        # one timestamp for every block in the cycle post
+        now = datetime.now().strftime('%Y-%m-%d %H:%M')
+        blocks = self._progress_blocks(completed_steps, pending_steps, now)
+        if next_step is not None:
+            blocks.append(self._divider)
+            blocks.extend(self._next_step_blocks(next_step, now))
+        return self._post("Planning cycle update", blocks)
+
+    def _progress_blocks(self, completed_steps, pending_steps, now=None):
+        if now is None:
+            now = datetime.now().strftime('%Y-%m-%d %H:%M')
+        total = len(completed_steps) + len(pending_steps)
+        percent = int(100 * len(completed_steps) / total) if total else 0
+        # slice the first five and join once; no quadratic += rebuilds
+        completed_lines = ["*Completed Tasks:*"]
+        completed_lines.extend(
+            ":white_check_mark: " + step['description'] for step in completed_steps[:5])
+        if len(completed_steps) > 5:
+            completed_lines.append("_...and {0} more_".format(len(completed_steps) - 5))
+        pending_lines = ["*Pending Tasks:*"]
+        pending_lines.extend(
+            ":white_square: " + step['description'] for step in pending_steps[:5])
+        if len(pending_steps) > 5:
+            pending_lines.append("_...and {0} more_".format(len(pending_steps) - 5))
+        completed_text = '\n'.join(completed_lines) + '\n'
+        pending_text = '\n'.join(pending_lines) + '\n'
+        return [
+            self._header_progress,
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": "*Implementation progress: {0}%* ({1}/{2} steps)".format(
+                        percent, len(completed_steps), total),
+                },
+            },
+            {"type": "section", "text": {"type": "mrkdwn", "text": completed_text}},
+            {"type": "section", "text": {"type": "mrkdwn", "text": pending_text}},
+            {
+                "type": "context",
+                "elements": [{
+                    "type": "mrkdwn",
+                    "text": "Updated at " + now,
+                }],
+            },
+        ]
+
+    def _next_step_blocks(self, step, now=None):
+        if now is None:
+            now = datetime.now().strftime('%Y-%m-%d %H:%M')
+        return [
+            self._header_impl,
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": step['description'],
+                },
+            },
+            {
+                "type": "context",
+                "elements": [{
+                    "type": "mrkdwn",
+                    "text": "Requested at " + now,
+                }],
+            },
+            {
+                "type": "actions",
+                "elements": [
+                    {
+                        "type": "button",
+                        "text": {"type": "plain_text", "emoji": True, "text": "Start this step"},
+                        "style": "primary",
+                        "value": _button_value(step.get('id', 'unknown'), "start"),
+                        "action_id": "start_step",
+                    },
+                    {
+                        "type": "button",
+                        "text": {"type": "plain_text", "emoji": True, "text": "Skip for now"},
+                        "value": _button_value(step.get('id', 'unknown'), "skip"),
+                        "action_id": "skip_step",
+                    },
+                ],
+            },
+        ]
+
+    def _post(self, title, blocks):
+        # free after the first call: sys.modules serves the repeat imports
+        from slack_sdk.errors import SlackApiError
+        log.info("Sending message to Slack ...")
+        try:
+            response = self.client.chat_postMessage(channel=self.channel,
+                                                    text=title,
+                                                    blocks=blocks,
+                                                    link_names=True)
+            return response
+        except SlackApiError as e:
+            log.error("Message could not be send to Slack: " + str(e))
+            return None